@@ -0,0 +1,83 @@
+"""Per-turn construction cost of model clients and chains, rebuilt vs. cached.
+
+Before the process-wide caches, every turn built a new ChatGroq (plus its Groq SDK and
+HTTP clients), prompt template and tool binding for the router chain, the character chain
+and the memory-analysis model. This script measures that work with the caches cleared
+before each turn ("rebuilt") and with the caches warm ("cached"): wall time and the memory
+allocated per turn (tracemalloc). No request is sent to Groq.
+
+    uv run python benchmarks/chain_construction_overhead.py --turns 200
+"""
+
+import argparse
+import gc
+import statistics
+import time
+import tracemalloc
+from functools import lru_cache
+
+from ai_companion.graph.utils.chains import get_character_response_chain, get_router_chain
+from ai_companion.modules.memory.long_term.memory_manager import MemoryAnalysis
+from ai_companion.modules.runtime import get_groq_model
+from ai_companion.settings import settings
+
+
+@lru_cache
+def memory_analysis_model():
+    """The model MemoryManager builds in __init__ (get_memory_manager is cached as well)."""
+    return get_groq_model(settings.SMALL_TEXT_MODEL_NAME, temperature=0.1).with_structured_output(MemoryAnalysis)
+
+
+def build_turn() -> None:
+    """What the nodes of one conversation turn construct before calling the LLMs."""
+    get_router_chain()
+    get_character_response_chain()
+    memory_analysis_model()
+
+
+def clear_caches() -> None:
+    get_router_chain.cache_clear()
+    get_character_response_chain.cache_clear()
+    get_groq_model.cache_clear()
+    memory_analysis_model.cache_clear()
+
+
+def measure(turns: int, rebuild: bool) -> tuple[list[float], list[int]]:
+    build_turn()  # warm imports and caches
+    durations, allocations = [], []
+    for _ in range(turns):
+        if rebuild:
+            clear_caches()
+        start = time.perf_counter()
+        build_turn()
+        durations.append((time.perf_counter() - start) * 1000)
+
+    # Allocations are traced in a separate pass so tracemalloc does not inflate the timings
+    for _ in range(min(turns, 20)):
+        if rebuild:
+            clear_caches()
+        gc.collect()
+        tracemalloc.start()
+        build_turn()
+        allocations.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return durations, allocations
+
+
+def main(turns: int) -> None:
+    results = {}
+    for label, rebuild in (("rebuilt", True), ("cached", False)):
+        durations, allocations = measure(turns, rebuild)
+        results[label] = statistics.median(durations)
+        print(
+            f"{label:>8}: p50 {statistics.median(durations):.3f} ms/turn   "
+            f"peak allocated {statistics.median(allocations) / 1024:.1f} KiB/turn"
+        )
+    print(f"construction time saved per turn: {results['rebuilt'] - results['cached']:.3f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=200)
+    args = parser.parse_args()
+    main(args.turns)
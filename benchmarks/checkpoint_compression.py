@@ -0,0 +1,188 @@
+"""Size and read latency of the checkpoint database with compressed, deduplicated payloads.
+
+Replays a synthetic corpus of conversations (short questions, long Spanish replies, voice
+note transcripts and image analyses) through a graph of seven nodes, the number of
+checkpoints the workflow graph writes per turn, with a TunedAsyncSqliteSaver. The zstd
+dictionary is trained, as the CLI in ai_companion.modules.memory.short_term.serde does,
+on a database of other conversations from the same generator. Compares:
+
+- plain: the default JsonPlusSerializer
+- zstd: ZstdSerializer without a dictionary
+- zstd + dict: ZstdSerializer with the trained dictionary
+- dedupe: plain payloads, messages stored once per thread
+- zstd + dict + dedupe: both
+
+Reports the database size, the time spent writing and the latency of ``aget_state`` on a
+freshly opened checkpointer: the first read of each thread (cold) and the following
+``--rounds`` - 1 (warm, as every turn of a conversation reads its state again). Checks that
+every state round-trips to the plain one.
+
+    uv run --extra compression python benchmarks/checkpoint_compression.py --threads 50 --turns 30
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.graph import END, START, MessagesState, StateGraph
+
+from ai_companion.modules.memory.short_term.checkpointer import TunedAsyncSqliteSaver
+from ai_companion.modules.memory.short_term.serde import ZstdSerializer, collect_samples, train_dictionary
+
+NODES = 7
+
+WORDS = (
+    "el la los las un una de del en con por para que como pero cuando donde muy más también seminario "
+    "curso sesión presencial online precio fecha duración horas semana mañana tarde noche ciudad Madrid "
+    "Barcelona inscripción plazas pago tarjeta transferencia descuento grupo empresa certificado diploma "
+    "material libro ejercicio práctica meditación respiración energía cuerpo mente emoción calma estrés "
+    "trabajo familia hijos pareja amigos viaje vacaciones verano invierno lluvia sol playa montaña casa "
+    "cocina comida cena desayuno café música película serie libro perro gato jardín coche tren avión "
+    "quiero puedo necesito tengo creo pienso siento gusta encanta preocupa ayuda explica cuenta dime "
+    "claro perfecto genial entiendo vale bueno gracias hola adiós luego pronto siempre nunca quizás"
+).split()
+IMAGE_OBJECTS = (
+    "una persona sonriendo|un perro en un parque|una taza de café|un paisaje de montaña|una pizarra con notas".split(
+        "|"
+    )
+)
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + rng.choice(".?!.")
+
+
+def paragraph(rng: random.Random, sentences: int) -> str:
+    return " ".join(sentence(rng, rng.randint(6, 18)) for _ in range(sentences))
+
+
+def user_message(rng: random.Random, index: int) -> HumanMessage:
+    kind = rng.random()
+    if kind < 0.15:
+        content = paragraph(rng, rng.randint(15, 40))  # transcript of a voice note
+    elif kind < 0.25:
+        content = (
+            f"{sentence(rng, 8)}\n[Image Analysis: La imagen muestra {rng.choice(IMAGE_OBJECTS)}. "
+            f"{paragraph(rng, rng.randint(4, 10))}]"
+        )
+    else:
+        content = sentence(rng, rng.randint(4, 20))
+    return HumanMessage(content=content, id=f"human-{index}")
+
+
+def corpus(seed: int, threads: int, turns: int) -> dict[str, list[tuple[HumanMessage, AIMessage]]]:
+    rng = random.Random(seed)
+    return {
+        f"thread-{seed}-{thread}": [
+            (user_message(rng, turn), AIMessage(content=paragraph(rng, rng.randint(2, 8)), id=f"ai-{turn}"))
+            for turn in range(turns)
+        ]
+        for thread in range(threads)
+    }
+
+
+def build_graph(replies: dict[str, AIMessage]) -> StateGraph:
+    """A chain of NODES nodes; the last one appends the reply of the conversation's corpus."""
+    graph = StateGraph(MessagesState)
+
+    def make_node(index: int):
+        async def node(state: MessagesState, config):
+            if index == NODES - 1:
+                return {"messages": [replies[state["messages"][-1].id, config["configurable"]["thread_id"]]]}
+            return {}
+
+        return node
+
+    previous = START
+    for index in range(NODES):
+        graph.add_node(f"node_{index}", make_node(index))
+        graph.add_edge(previous, f"node_{index}")
+        previous = f"node_{index}"
+    graph.add_edge(previous, END)
+    return graph
+
+
+def database_size(db_path: str) -> int:
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    conn.close()
+    return os.path.getsize(db_path)
+
+
+async def write(conversations, db_path: str, **kwargs) -> float:
+    replies = {(human.id, thread): ai for thread, turns in conversations.items() for human, ai in turns}
+    start = time.perf_counter()
+    async with TunedAsyncSqliteSaver.from_conn_string(db_path, **kwargs) as checkpointer:
+        graph = build_graph(replies).compile(checkpointer=checkpointer)
+
+        async def conversation(thread: str) -> None:
+            config = {"configurable": {"thread_id": thread}}
+            for human, _ in conversations[thread]:
+                await graph.ainvoke({"messages": [human]}, config)
+
+        await asyncio.gather(*(conversation(thread) for thread in conversations))
+    return time.perf_counter() - start
+
+
+async def read(conversations, db_path: str, rounds: int, **kwargs) -> tuple[list[list[float]], dict[str, list]]:
+    """``aget_state`` latencies of each round over all the threads, and the last states read."""
+    latencies, states = [], {}
+    async with TunedAsyncSqliteSaver.from_conn_string(db_path, **kwargs) as checkpointer:
+        graph = build_graph({}).compile(checkpointer=checkpointer)
+        for _ in range(rounds):
+            latencies.append([])
+            for thread in conversations:
+                start = time.perf_counter()
+                state = await graph.aget_state({"configurable": {"thread_id": thread}})
+                latencies[-1].append(time.perf_counter() - start)
+                states[thread] = [(type(m).__name__, m.id, m.content) for m in state.values["messages"]]
+    return latencies, states
+
+
+async def main(threads: int, turns: int, rounds: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        training_db = os.path.join(tmp, "training.db")
+        await write(corpus(1, max(threads // 5, 5), turns), training_db)
+        samples = collect_samples(training_db, JsonPlusSerializer())
+        dictionary = train_dictionary(samples)
+        print(f"dictionary: {len(dictionary)} bytes trained on {len(samples)} samples\n")
+
+        configurations = {
+            "plain": {},
+            "zstd": {"serde": ZstdSerializer()},
+            "zstd + dict": {"serde": ZstdSerializer(dictionary=dictionary)},
+            "dedupe": {"dedupe_messages": True},
+            "zstd + dict + dedupe": {"serde": ZstdSerializer(dictionary=dictionary), "dedupe_messages": True},
+        }
+        conversations = corpus(0, threads, turns)
+        expected = None
+        for label, kwargs in configurations.items():
+            db_path = os.path.join(tmp, f"{label.replace(' ', '_')}.db")
+            elapsed = await write(conversations, db_path, **kwargs)
+            latencies, states = await read(conversations, db_path, rounds, **kwargs)
+            expected = expected or states
+            size = database_size(db_path)
+            warm = [latency for round_ in latencies[1:] for latency in round_]
+            print(
+                f"{label:>21}: db {size / 2**20:7.1f} MiB   write {elapsed:6.2f} s   "
+                f"aget_state p50 cold {statistics.median(latencies[0]) * 1000:5.2f} ms "
+                f"warm {statistics.median(warm or latencies[0]) * 1000:5.2f} ms   "
+                f"round-trip {'ok' if states == expected else 'MISMATCH'}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=50)
+    parser.add_argument("--turns", type=int, default=30)
+    parser.add_argument("--rounds", type=int, default=5, help="aget_state calls per thread")
+    args = parser.parse_args()
+    asyncio.run(main(args.threads, args.turns, args.rounds))
@@ -0,0 +1,120 @@
+"""Growth of the checkpoint database per 1k audio turns, media in state vs. in the blob store.
+
+Runs audio turns through the real workflow graph with an AsyncSqliteSaver checkpointer and
+stub providers (router, character LLM, text-to-speech returning AUDIO_BYTES of random
+data, like a short MP3). Turns are spread over several users, as in production. Compares:
+
+- inline: the synthesised audio is written into the graph state (the previous
+  ``audio_buffer``), so it is persisted in every checkpoint written after it
+- blob store: audio_node stores the audio in the BlobStore and the state only carries
+  its MediaRef
+
+Reports the size of the checkpoint database (with its WAL) and of the blob store,
+normalised to 1k turns.
+
+    uv run python benchmarks/checkpoint_growth.py --turns 1000 --users 50
+"""
+
+import argparse
+import asyncio
+import itertools
+import os
+import tempfile
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.runnables import RunnableLambda
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+import ai_companion.graph.graph as graph_module
+import ai_companion.graph.nodes as nodes
+from ai_companion.graph.graph import create_workflow_graph
+from ai_companion.graph.utils.helpers import AsteriskRemovalParser
+from ai_companion.modules.media import blob_store
+from ai_companion.settings import settings
+
+AUDIO_BYTES = 64 * 1024  # ~4 s of MP3 at 128 kbps
+REPLY = "Claro, te lo cuento con mucho gusto. El seminario dura unas cinco horas y es presencial."
+
+
+class StubRouter:
+    async def route(self, messages):
+        return "audio"
+
+
+class StubMemoryManager:
+    def search_relevant_memories(self, context, session_id):
+        return []
+
+    def format_memories_for_prompt(self, memories):
+        return ""
+
+
+class StubTextToSpeech:
+    async def synthesize(self, text: str) -> bytes:
+        return os.urandom(AUDIO_BYTES)
+
+
+def make_chain():
+    model = GenericFakeChatModel(messages=itertools.repeat(AIMessage(content=REPLY)))
+    return RunnableLambda(lambda inputs: inputs["messages"]) | model | AsteriskRemovalParser()
+
+
+async def inline_audio_node(state, config):
+    """audio_node as it used to be: the audio bytes themselves go into the state."""
+    result = await nodes.audio_node(state, config)
+    return {**result, "audio_ref": blob_store.get_blob_store().get(result["audio_ref"])}
+
+
+def directory_size(path: str) -> int:
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, files in os.walk(path) for name in files)
+
+
+async def run(inline: bool, turns: int, users: int, tmp: str) -> tuple[int, int]:
+    db_path = os.path.join(tmp, f"checkpoints_{inline}.db")
+    settings.MEDIA_BLOB_STORE_PATH = os.path.join(tmp, f"media_{inline}")
+    blob_store.get_blob_store.cache_clear()
+
+    graph_module.audio_node = inline_audio_node if inline else nodes.audio_node
+    async with AsyncSqliteSaver.from_conn_string(db_path) as checkpointer:
+        graph = create_workflow_graph().compile(checkpointer=checkpointer)
+        for turn in range(turns):
+            config = {"configurable": {"thread_id": f"user-{turn % users}"}}
+            await graph.ainvoke(
+                {"messages": [HumanMessage(content=f"Mándame un audio sobre el seminario ({turn})")]}, config
+            )
+
+    database = sum(os.path.getsize(path) for path in (db_path, f"{db_path}-wal") if os.path.exists(path))
+    media = directory_size(settings.MEDIA_BLOB_STORE_PATH) if not inline else 0
+    return database, media
+
+
+async def main(turns: int, users: int) -> None:
+    original_audio_node = graph_module.audio_node
+    settings.ANSWER_CACHE_ENABLED = False
+    settings.MEMORY_EXTRACTION_IN_BACKGROUND = True
+    settings.SUMMARY_IN_BACKGROUND = True
+    nodes.router = StubRouter()
+    nodes.get_memory_manager = StubMemoryManager
+    nodes.get_character_response_chain = make_chain
+    nodes.get_text_to_speech_module = StubTextToSpeech
+
+    scale = 1000 / turns
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            for label, inline in (("inline", True), ("blob store", False)):
+                database, media = await run(inline, turns, users, tmp)
+                print(
+                    f"{label:>10}: checkpoint DB {database * scale / 2**20:8.1f} MiB / 1k audio turns   "
+                    f"blob store {media * scale / 2**20:6.1f} MiB / 1k audio turns"
+                )
+        finally:
+            graph_module.audio_node = original_audio_node
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=1000)
+    parser.add_argument("--users", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.turns, args.users))
@@ -0,0 +1,71 @@
+"""Per-turn overhead of compiling the graph and opening the checkpointer on every message.
+
+"per-message" reproduces what the interfaces used to do on each turn: open
+``AsyncSqliteSaver.from_conn_string(...)``, ``graph_builder.compile(checkpointer=...)``, read
+the thread state and close the connection. "runtime" reuses the compiled graph and the open
+checkpointer from ``graph_runtime``. No LLM is called: only the fixed cost around a turn is
+measured, against a thread that already has some checkpoints.
+
+    uv run python benchmarks/graph_compile_overhead.py --turns 200
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+from ai_companion.settings import settings
+
+
+def report(label: str, timings: list[float]) -> float:
+    p50 = statistics.median(timings)
+    p95 = statistics.quantiles(timings, n=20)[-1]
+    print(f"{label:>12}: p50 {p50:.2f} ms   p95 {p95:.2f} ms")
+    return p50
+
+
+async def main(turns: int) -> None:
+    settings.SHORT_TERM_MEMORY_DB_PATH = os.path.join(tempfile.mkdtemp(), "memory.db")
+
+    # Imported after the DB path is set so the runtime uses the temporary database
+    from ai_companion.graph import graph_builder, graph_runtime
+
+    config = {"configurable": {"thread_id": "benchmark"}}
+    graph = await graph_runtime.start()
+    history = [
+        HumanMessage(content=f"mensaje {i}") if i % 2 == 0 else AIMessage(content=f"respuesta {i}") for i in range(20)
+    ]
+    await graph.aupdate_state(config, {"messages": history, "summary": "", "workflow": "conversation"})
+
+    per_message = []
+    for _ in range(turns):
+        start = time.perf_counter()
+        async with AsyncSqliteSaver.from_conn_string(settings.SHORT_TERM_MEMORY_DB_PATH) as short_term_memory:
+            compiled = graph_builder.compile(checkpointer=short_term_memory)
+            await compiled.aget_state(config)
+        per_message.append((time.perf_counter() - start) * 1000)
+
+    runtime = []
+    for _ in range(turns):
+        start = time.perf_counter()
+        compiled = await graph_runtime.get_graph()
+        await compiled.aget_state(config)
+        runtime.append((time.perf_counter() - start) * 1000)
+
+    await graph_runtime.stop()
+
+    before = report("per-message", per_message)
+    after = report("runtime", runtime)
+    print(f"overhead removed per turn (p50): {before - after:.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.turns))
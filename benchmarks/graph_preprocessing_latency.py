@@ -0,0 +1,116 @@
+"""Critical-path latency of a turn with sequential vs. fan-out/fan-in preprocessing.
+
+Builds the real workflow graph with GRAPH_PARALLEL_PREPROCESSING off and on, and with
+long-term memory extraction inline or deferred to the background job
+(MEMORY_EXTRACTION_IN_BACKGROUND), with the providers replaced by stubs that sleep for typical latencies: router LLM, memory-analysis LLM,
+Qdrant search/upsert and the character LLM. Reports the time until ``conversation_node``
+starts (the preprocessing critical path) and the full turn time.
+
+    uv run python benchmarks/graph_preprocessing_latency.py --turns 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+import ai_companion.graph.nodes as nodes
+from ai_companion.graph.graph import create_workflow_graph
+from ai_companion.graph.utils.chains import RouterResponse
+from ai_companion.modules.memory.long_term.vector_store import Memory
+from ai_companion.settings import settings
+
+LATENCY = {
+    "router_llm": 0.35,
+    "memory_llm": 0.30,
+    "qdrant_search": 0.06,
+    "qdrant_upsert": 0.04,
+    "conversation_llm": 0.80,
+}
+
+
+class StubRouterChain:
+    async def ainvoke(self, inputs, config=None):
+        await asyncio.sleep(LATENCY["router_llm"])
+        return RouterResponse(response_type="conversation")
+
+
+class StubCharacterChain:
+    def __init__(self, marks: dict) -> None:
+        self.marks = marks
+
+    async def ainvoke(self, inputs, config=None):
+        self.marks["conversation_start"] = time.perf_counter()
+        await asyncio.sleep(LATENCY["conversation_llm"])
+        return AIMessage(content="respuesta")
+
+
+class StubMemoryManager:
+    async def extract_and_store_memories(self, message, session_id):
+        await asyncio.sleep(LATENCY["memory_llm"])
+        await asyncio.to_thread(time.sleep, LATENCY["qdrant_search"])
+        await asyncio.to_thread(time.sleep, LATENCY["qdrant_upsert"])
+
+    def search_relevant_memories(self, context, session_id):
+        time.sleep(LATENCY["qdrant_search"])
+        return [
+            Memory(
+                text="El usuario fuma desde hace 10 años", metadata={"source_collection": "long_term_memory"}, score=0.6
+            )
+        ]
+
+    def format_memories_for_prompt(self, memories):
+        return "\n".join(f"- {memory}" for memory in memories)
+
+
+async def measure(parallel: bool, background: bool, turns: int) -> tuple[list[float], list[float]]:
+    settings.GRAPH_PARALLEL_PREPROCESSING = parallel
+    settings.MEMORY_EXTRACTION_IN_BACKGROUND = background
+    settings.ANSWER_CACHE_ENABLED = False
+    marks: dict = {}
+    nodes.get_router_chain = StubRouterChain
+    nodes.get_memory_manager = StubMemoryManager
+    nodes.get_character_response_chain = lambda *args, **kwargs: StubCharacterChain(marks)
+    # Keep the router LLM on the critical path; benchmarks/router_eval.py covers the local tier
+    nodes.router.use_local_classifier = False
+    nodes.router.cache_size = 0
+    graph = create_workflow_graph().compile()
+
+    critical_path, total = [], []
+    for turn in range(turns):
+        start = time.perf_counter()
+        await graph.ainvoke(
+            {"messages": [HumanMessage(content=f"hola, quiero dejar de fumar ({turn})")]},
+            {"configurable": {"thread_id": "benchmark"}},
+        )
+        end = time.perf_counter()
+        critical_path.append((marks["conversation_start"] - start) * 1000)
+        total.append((end - start) * 1000)
+    return critical_path, total
+
+
+async def main(turns: int) -> None:
+    results = {}
+    configurations = (
+        ("sequential", False, False),
+        ("fan-out", True, False),
+        ("background", True, True),
+    )
+    for label, parallel, background in configurations:
+        critical_path, total = await measure(parallel, background, turns)
+        results[label] = statistics.median(critical_path)
+        print(
+            f"{label:>10}: until conversation_node p50 {results[label]:.0f} ms   "
+            f"full turn p50 {statistics.median(total):.0f} ms"
+        )
+    print(f"critical path saved by fan-out: {results['sequential'] - results['fan-out']:.0f} ms")
+    print(f"critical path saved by background memory: {results['fan-out'] - results['background']:.0f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.turns))
@@ -0,0 +1,92 @@
+"""Prefix-cache hit ratio of the character prompt, volatile context inline vs. trailing.
+
+Simulates several users chatting concurrently and renders every turn's prompt with:
+
+- inline: memories, user name, activity and summary interpolated into the system block
+  (the previous layout, which changes the very first message on every turn)
+- trailing: the static ALLEN_CARR_SELLER_PROMPT first, then the history, then the volatile
+  context in a trailing system message (the layout of get_character_response_chain)
+
+The history goes through a ContextBuilder with ``--budget`` tokens, which drops old messages
+one at a time (``--block 1``) or ``--block`` messages at a time. Each prompt goes through a
+PrefixCacheMonitor, which reports how many prompt tokens a provider-side prefix cache would
+have reused. No request is sent to Groq.
+
+    uv run python benchmarks/prompt_prefix_cache.py --users 20 --turns 40 --budget 5000 --block 10
+"""
+
+import argparse
+import random
+
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+
+from ai_companion.core.prompts import ALLEN_CARR_SELLER_PROMPT, CHARACTER_CONTEXT_PROMPT
+from ai_companion.graph.utils.chains import format_summary_context, get_character_response_chain
+from ai_companion.graph.utils.context import ContextBuilder
+from ai_companion.graph.utils.prompt_cache import PrefixCacheMonitor
+
+MEMORIES = [
+    "- El usuario fuma 20 cigarrillos al día",
+    "- El usuario intentó dejarlo con parches",
+    "- El usuario vive en Lima",
+    "- Al usuario le preocupa engordar",
+    "- El usuario fuma desde los 16 años",
+]
+ACTIVITIES = ["Respondiendo mensajes de clientes", "Preparando el seminario del sábado"]
+
+
+def inline_prompt() -> ChatPromptTemplate:
+    return ChatPromptTemplate.from_messages(
+        [("system", ALLEN_CARR_SELLER_PROMPT + CHARACTER_CONTEXT_PROMPT), MessagesPlaceholder(variable_name="messages")]
+    ).partial(tools="", tool_names="")
+
+
+def main(users: int, turns: int, seed: int, budget: int, block: int) -> None:
+    rng = random.Random(seed)
+    system_prompt = ALLEN_CARR_SELLER_PROMPT + CHARACTER_CONTEXT_PROMPT
+    sliding = ContextBuilder(system_prompt, budget=budget)
+    blocks = ContextBuilder(system_prompt, budget=budget, block_messages=block)
+    trailing = get_character_response_chain().first
+    layouts = {
+        "inline": (inline_prompt(), sliding, PrefixCacheMonitor(name="benchmark_prefix_inline")),
+        "trailing": (trailing, sliding, PrefixCacheMonitor(name="benchmark_prefix_trailing")),
+        f"trailing, block {block}": (trailing, blocks, PrefixCacheMonitor(name="benchmark_prefix_blocks")),
+    }
+    histories = {user: [] for user in range(users)}
+
+    for turn in range(turns):
+        for user in range(users):
+            history = histories[user]
+            history.append(
+                HumanMessage(
+                    content=f"Mensaje {turn} del usuario {user} sobre su hábito de fumar. " * rng.randint(1, 8),
+                    id=f"{user}-{turn}-human",
+                )
+            )
+            inputs = {
+                "memory_context": "\n".join(rng.sample(MEMORIES, 2)),
+                "user_name": f"Usuario {user}",
+                "current_activity": ACTIVITIES[turn * len(ACTIVITIES) // turns],
+                "summary_context": format_summary_context(
+                    "El usuario quiere dejar de fumar." if turn > turns // 2 else ""
+                ),
+            }
+            for prompt, builder, monitor in layouts.values():
+                window = builder.build(history)
+                monitor.observe(prompt.invoke({**inputs, "messages": window.messages}).to_messages())
+            history.append(AIMessage(content=f"Respuesta {turn} para el usuario {user}.", id=f"{user}-{turn}-ai"))
+
+    for label, (_, _, monitor) in layouts.items():
+        print(f"{label:>18}: prefix-cache hit ratio {monitor.hit_ratio():.1%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--turns", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--budget", type=int, default=5000, help="Token budget of the context builder")
+    parser.add_argument("--block", type=int, default=10, help="Messages dropped at a time")
+    args = parser.parse_args()
+    main(args.users, args.turns, args.seed, args.budget, args.block)
@@ -0,0 +1,158 @@
+"""Accuracy, coverage and latency of the tiered router.
+
+Runs the labelled cases below (the three examples of notebooks/router.ipynb plus Spanish and
+English turns typical of the seller conversation) through the local classifier and reports:
+
+- coverage: share of turns resolved locally, without calling the LLM
+- precision: share of local decisions that match the label
+- escalations that were actually media requests (they still reach the LLM, so they are only
+  slower, never wrong)
+- p50/p99 latency of the local tier
+
+With ``--llm`` every case is also sent to the LLM router chain (requires GROQ_API_KEY) to
+compare latency and accuracy of the LLM-only and tiered routers.
+
+    uv run python benchmarks/router_eval.py
+    uv run python benchmarks/router_eval.py --llm
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from ai_companion.graph.utils.chains import get_router_chain
+from ai_companion.graph.utils.router import TieredRouter, classify_locally
+
+CASES = [
+    # notebooks/router.ipynb
+    (
+        "conversation",
+        [
+            HumanMessage(content="Hello, how are you?"),
+            AIMessage(content="I'm fine, thank you!"),
+            HumanMessage(content="My name is Miguel by the way! You?"),
+        ],
+    ),
+    (
+        "image",
+        [
+            HumanMessage(content="So what are you doing right now?"),
+            AIMessage(content="I'm looking at a very beautiful landscape from my window. It's a very nice day today!"),
+            HumanMessage(content="Send me a picture of that!"),
+        ],
+    ),
+    (
+        "audio",
+        [
+            HumanMessage(content="Do you have any hobbies?"),
+            AIMessage(content="I like to sing when I'm alone. You?"),
+            HumanMessage(content="Really? Now that you mention it, I've never heard your voice!"),
+        ],
+    ),
+    # Spanish seller conversation
+    ("conversation", [HumanMessage(content="Hola, buenas tardes")]),
+    ("conversation", [HumanMessage(content="Me llamo Ana y fumo desde hace 10 años")]),
+    (
+        "conversation",
+        [
+            HumanMessage(content="Hola"),
+            AIMessage(content="¡Hola! ¿Cuántos cigarrillos fumas al día?"),
+            HumanMessage(content="Unos 20, a veces más cuando estoy estresada"),
+        ],
+    ),
+    ("conversation", [HumanMessage(content="¿Cuánto cuesta el seminario y cuándo es el próximo?")]),
+    ("conversation", [HumanMessage(content="Sí, me quiero inscribir")]),
+    ("conversation", [HumanMessage(content="Tengo miedo de engordar si lo dejo")]),
+    ("conversation", [HumanMessage(content="I want to quit smoking, can you help me?")]),
+    ("audio", [HumanMessage(content="Mándame un audio explicándome el método")]),
+    ("audio", [HumanMessage(content="¿Me puedes enviar una nota de voz?")]),
+    ("audio", [HumanMessage(content="Quiero oír tu voz")]),
+    ("audio", [HumanMessage(content="Dímelo en audio por favor")]),
+    ("audio", [HumanMessage(content="Can you send me a voice message?")]),
+    ("image", [HumanMessage(content="Envíame una foto del lugar del seminario")]),
+    ("image", [HumanMessage(content="Muéstrame una imagen de cómo quedan los pulmones")]),
+    ("image", [HumanMessage(content="Show me a photo of you")]),
+    (
+        "conversation",
+        [
+            AIMessage(content="¿Quieres que te mande un audio con más detalles?"),
+            HumanMessage(content="No, mejor por escrito"),
+        ],
+    ),
+    ("conversation", [HumanMessage(content="No me mandes audios, no los puedo escuchar en el trabajo")]),
+    ("conversation", [HumanMessage(content="Vi una foto de unos pulmones y me asusté")]),
+]
+
+
+class ReplayChain:
+    """Answers with the label, standing in for the LLM when ``--llm`` is not given."""
+
+    def __init__(self, labels: dict) -> None:
+        self.labels = labels
+
+    async def ainvoke(self, inputs, config=None):
+        return type("RouterResponse", (), {"response_type": self.labels[TieredRouter.cache_key(inputs["messages"])]})
+
+
+def percentile(values: list[float], q: float) -> float:
+    return sorted(values)[min(len(values) - 1, int(q * len(values)))]
+
+
+async def main(use_llm: bool, repeat: int) -> None:
+    local_latency, resolved, correct, missed_media = [], 0, 0, 0
+    for label, messages in CASES:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            decision = classify_locally(messages)
+            local_latency.append((time.perf_counter() - start) * 1e6)
+        if decision is None:
+            missed_media += label != "conversation"
+            print(f"  escalated  [{label:>12}] {messages[-1].content}")
+            continue
+        resolved += 1
+        correct += decision == label
+        status = "ok" if decision == label else f"WRONG ({decision})"
+        print(f"  local {status:>4} [{label:>12}] {messages[-1].content}")
+
+    print(f"\ncases: {len(CASES)}")
+    print(f"coverage (resolved locally): {resolved / len(CASES):.0%}")
+    print(f"precision of local decisions: {correct / max(resolved, 1):.0%}")
+    print(f"media requests escalated to the LLM: {missed_media}")
+    print(
+        f"local tier latency: p50 {statistics.median(local_latency):.1f} µs   p99 {percentile(local_latency, 0.99):.1f} µs"
+    )
+
+    if not use_llm:
+        labels = {TieredRouter.cache_key(messages): label for label, messages in CASES}
+        router = TieredRouter(lambda: ReplayChain(labels), name="router_eval")
+        decisions = [await router.route(messages) for _, messages in CASES]
+        accuracy = sum(decision == label for decision, (label, _) in zip(decisions, CASES)) / len(CASES)
+        print(f"tiered accuracy (LLM tier replaying the labels): {accuracy:.0%}")
+        return
+
+    chain = get_router_chain()
+    for name, router in (
+        ("llm only", TieredRouter(lambda: chain, cache_size=0, use_local_classifier=False, name="router_llm_only")),
+        ("tiered", TieredRouter(lambda: chain, name="router_tiered")),
+    ):
+        latency, hits = [], 0
+        for label, messages in CASES:
+            start = time.perf_counter()
+            decision = await router.route(messages)
+            latency.append((time.perf_counter() - start) * 1000)
+            hits += decision == label
+        print(
+            f"{name:>9}: accuracy {hits / len(CASES):.0%}   p50 {statistics.median(latency):.1f} ms   "
+            f"p99 {percentile(latency, 0.99):.1f} ms   total {sum(latency):.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--llm", action="store_true", help="also call the LLM router chain")
+    parser.add_argument("--repeat", type=int, default=1000, help="local classifier runs per case")
+    args = parser.parse_args()
+    asyncio.run(main(args.llm, args.repeat))
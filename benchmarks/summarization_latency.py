@@ -0,0 +1,112 @@
+"""Reply latency of a conversation with inline vs. deferred summarisation.
+
+Runs a conversation of long user turns through the real workflow graph (with a SQLite
+checkpointer) and stub providers that sleep for typical latencies. Compares:
+
+- inline: summarize_conversation_node runs inside the turn, before the reply can be sent
+  (the previous behaviour, with the summary model latency of the 70B model)
+- background: the reply is returned first and ConversationSummarizer folds the old
+  messages afterwards, with the small model, serialised with the session's turns
+
+Reports p50/max reply latency, the number of summaries and the final state size.
+
+    uv run python benchmarks/summarization_latency.py --turns 40
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+import ai_companion.graph.nodes as nodes
+import ai_companion.graph.summarization as summarization
+from ai_companion.graph.graph import create_workflow_graph
+from ai_companion.graph.summarization import conversation_summarizer
+from ai_companion.modules.runtime import SessionScheduler
+from ai_companion.settings import settings
+
+LATENCY = {
+    "conversation_llm": 0.8,
+    "summary_llm_large": 3.0,
+    "summary_llm_small": 0.8,
+}
+
+
+class StubChain:
+    async def ainvoke(self, inputs, config=None):
+        await asyncio.sleep(LATENCY["conversation_llm"])
+        return AIMessage(content="Entiendo perfectamente lo que me cuentas. " * 20)
+
+
+class StubSummaryModel:
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+
+    async def ainvoke(self, messages):
+        await asyncio.sleep(self.latency)
+        return AIMessage(content=f"Resumen de {len(messages) - 1} mensajes.")
+
+
+class StubMemoryManager:
+    def search_relevant_memories(self, context, session_id):
+        return []
+
+    def format_memories_for_prompt(self, memories):
+        return ""
+
+
+async def run_conversation(background: bool, turns: int, db_path: str) -> tuple[list[float], int, int]:
+    settings.SUMMARY_IN_BACKGROUND = background
+    settings.MEMORY_EXTRACTION_IN_BACKGROUND = True
+    settings.ANSWER_CACHE_ENABLED = False
+    summary_latency = LATENCY["summary_llm_small" if background else "summary_llm_large"]
+    summarization.get_groq_model = lambda *args, **kwargs: StubSummaryModel(summary_latency)
+    nodes.get_character_response_chain = StubChain
+    nodes.get_memory_manager = StubMemoryManager
+    nodes.router.use_local_classifier = True
+
+    scheduler = SessionScheduler(name=f"summary_benchmark_{background}")
+    runs_before = summarization.metrics.counter("summarizer.runs").value
+    latencies = []
+    async with AsyncSqliteSaver.from_conn_string(db_path) as checkpointer:
+        graph = create_workflow_graph().compile(checkpointer=checkpointer)
+        config = {"configurable": {"thread_id": "benchmark"}}
+        for turn in range(turns):
+            content = f"Turno {turn}: te cuento que llevo años fumando y " + "me cuesta mucho dejarlo. " * 40
+
+            async def run_turn():
+                return await graph.ainvoke({"messages": [HumanMessage(content=content)]}, config)
+
+            start = time.perf_counter()
+            await scheduler.run("benchmark", run_turn)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if background:
+                conversation_summarizer.schedule(graph, "benchmark", scheduler)
+
+        await conversation_summarizer.join()
+        await scheduler.join()
+        state = await graph.aget_state(config)
+    summaries = summarization.metrics.counter("summarizer.runs").value - runs_before
+    return latencies, summaries, len(state.values["messages"])
+
+
+async def main(turns: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, background in (("inline", False), ("background", True)):
+            latencies, summaries, messages = await run_conversation(background, turns, os.path.join(tmp, f"{label}.db"))
+            print(
+                f"{label:>10}: reply p50 {statistics.median(latencies):.0f} ms   max {max(latencies):.0f} ms   "
+                f"summaries {summaries}   messages left {messages}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=40)
+    args = parser.parse_args()
+    asyncio.run(main(args.turns))
@@ -0,0 +1,104 @@
+"""Latency of an audio reply with serial vs. pipelined text-to-speech.
+
+Runs ``audio_node`` with a character chain that streams tokens at a typical Groq rate and a
+text-to-speech stub whose latency grows with the text length, for several reply lengths:
+
+- serial: the previous behaviour, the whole reply is generated and then synthesised in one
+  request (replies over TextToSpeech.MAX_TEXT_LENGTH raise ValueError)
+- pipelined: audio_node feeds the streamed tokens to SpeechPipeline, which synthesises
+  sentences concurrently while the rest of the reply is being generated
+
+No request is sent to Groq or ElevenLabs.
+
+    uv run python benchmarks/tts_pipeline_latency.py
+"""
+
+import argparse
+import asyncio
+import time
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.runnables import RunnableLambda
+
+import ai_companion.graph.nodes as nodes
+from ai_companion.graph.utils.helpers import AsteriskRemovalParser, remove_asterisk_content
+from ai_companion.modules.speech import TextToSpeech
+from ai_companion.settings import settings
+
+SECONDS_PER_TOKEN = 0.003
+TTS_BASE_SECONDS = 0.35
+TTS_SECONDS_PER_CHAR = 0.0015
+
+SENTENCES = [
+    "El método de Allen Carr no se basa en la fuerza de voluntad.",
+    "Durante el seminario entenderás por qué fumas y por qué no necesitas hacerlo.",
+    "La mayoría de las personas salen de la sesión sin ganas de volver a encender un cigarrillo.",
+    "Además, si lo necesitas, puedes repetir el seminario sin coste adicional.",
+]
+
+
+class StreamingModel(GenericFakeChatModel):
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        async for chunk in super()._astream(messages, stop=stop, run_manager=run_manager, **kwargs):
+            await asyncio.sleep(SECONDS_PER_TOKEN)
+            yield chunk
+
+
+class StubTextToSpeech:
+    async def synthesize(self, text: str) -> bytes:
+        if len(text) > TextToSpeech.MAX_TEXT_LENGTH:
+            raise ValueError(f"Input text exceeds maximum length of {TextToSpeech.MAX_TEXT_LENGTH} characters")
+        await asyncio.sleep(TTS_BASE_SECONDS + TTS_SECONDS_PER_CHAR * len(text))
+        return text.encode()
+
+
+def make_reply(chars: int) -> str:
+    sentences = []
+    while sum(len(sentence) + 1 for sentence in sentences) < chars:
+        sentences.append(SENTENCES[len(sentences) % len(SENTENCES)])
+    return " ".join(sentences)
+
+
+def make_model(reply: str) -> StreamingModel:
+    return StreamingModel(messages=iter([AIMessage(content=reply)]))
+
+
+def make_chain(reply: str):
+    return RunnableLambda(lambda inputs: inputs["messages"]) | make_model(reply) | AsteriskRemovalParser()
+
+
+async def serial(reply: str) -> float:
+    start = time.perf_counter()
+    # Same token stream as the pipelined run, but synthesised only once it is complete
+    model = make_model(reply)
+    tokens = [chunk.content async for chunk in model.astream([HumanMessage(content="Háblame del seminario")])]
+    await StubTextToSpeech().synthesize(remove_asterisk_content("".join(tokens)))
+    return time.perf_counter() - start
+
+
+async def pipelined(reply: str) -> float:
+    nodes.get_character_response_chain = lambda: make_chain(reply)
+    nodes.get_text_to_speech_module = StubTextToSpeech
+    state = {"messages": [HumanMessage(content="Háblame del seminario")], "user_name": "Ana"}
+    start = time.perf_counter()
+    await nodes.audio_node(state, {"configurable": {"thread_id": "benchmark"}})
+    return time.perf_counter() - start
+
+
+async def main(lengths: list[int]) -> None:
+    print(f"concurrency {settings.TTS_PIPELINE_CONCURRENCY}, min chunk {settings.TTS_PIPELINE_MIN_CHARS} chars")
+    for chars in lengths:
+        reply = make_reply(chars)
+        try:
+            serial_label = f"{await serial(reply) * 1000:6.0f} ms"
+        except ValueError:
+            serial_label = "ValueError"
+        print(f"{len(reply):>6} chars: serial {serial_label:>10}   pipelined {await pipelined(reply) * 1000:6.0f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lengths", type=int, nargs="+", default=[300, 1200, 3000, 6000])
+    args = parser.parse_args()
+    asyncio.run(main(args.lengths))
@@ -0,0 +1,178 @@
+"""Latency saved per turn by the shared Graph API HTTP client.
+
+Starts a local stub of the Graph API (TLS with a throwaway self-signed certificate when
+``openssl`` is available) and replays the HTTP traffic of an audio turn: media metadata,
+media download, media upload and message send. The "per-call" mode opens a new
+``httpx.AsyncClient`` per helper like the handlers used to (two for the audio download);
+the "shared" mode reuses the application-scoped client from ``http_client``.
+
+    uv run python benchmarks/whatsapp_http_client.py --turns 200
+"""
+
+import argparse
+import asyncio
+import os
+import shutil
+import socket
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, Request, Response
+
+from ai_companion.interfaces.whatsapp.http_client import MEDIA_TIMEOUT, create_http_client
+
+MEDIA_BYTES = os.urandom(200 * 1024)
+
+
+def build_stub(base_url: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/v22.0/media/{media_id}")
+    async def media(media_id: str) -> Response:
+        return Response(content=MEDIA_BYTES, media_type="audio/ogg")
+
+    @app.get("/v22.0/{media_id}")
+    async def metadata(media_id: str) -> dict:
+        return {"url": f"{base_url}/v22.0/media/{media_id}"}
+
+    @app.post("/v22.0/{phone_id}/media")
+    async def upload(phone_id: str, request: Request) -> dict:
+        await request.body()
+        return {"id": "uploaded-media-id"}
+
+    @app.post("/v22.0/{phone_id}/messages")
+    async def messages(phone_id: str, request: Request) -> dict:
+        await request.body()
+        return {"messages": [{"id": "wamid.stub"}]}
+
+    return app
+
+
+def self_signed_cert(directory: str) -> tuple[str, str] | None:
+    if shutil.which("openssl") is None:
+        return None
+    cert, key = os.path.join(directory, "cert.pem"), os.path.join(directory, "key.pem")
+    subprocess.run(
+        [
+            "openssl",
+            "req",
+            "-x509",
+            "-newkey",
+            "rsa:2048",
+            "-nodes",
+            "-days",
+            "1",
+            "-subj",
+            "/CN=127.0.0.1",
+            "-keyout",
+            key,
+            "-out",
+            cert,
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return cert, key
+
+
+def start_stub(use_tls: bool) -> str:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    cert = self_signed_cert(tempfile.mkdtemp()) if use_tls else None
+    scheme = "https" if cert else "http"
+    base_url = f"{scheme}://127.0.0.1:{port}"
+    config = uvicorn.Config(
+        build_stub(base_url),
+        port=port,
+        log_level="warning",
+        ssl_certfile=cert[0] if cert else None,
+        ssl_keyfile=cert[1] if cert else None,
+    )
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return base_url
+
+
+async def audio_turn(base_url: str, client_for_call) -> None:
+    """The Graph API calls of one audio turn; ``client_for_call`` yields the client for each helper."""
+    headers = {"Authorization": "Bearer stub"}
+
+    # process_audio_message: metadata and download
+    async with client_for_call() as client:
+        metadata = (await client.get(f"{base_url}/v22.0/audio-id", headers=headers)).json()
+    async with client_for_call() as client:
+        (await client.get(metadata["url"], headers=headers, timeout=MEDIA_TIMEOUT)).raise_for_status()
+
+    # send_response: upload_media and the message itself
+    async with client_for_call() as client:
+        files = {"file": ("response.mp3", MEDIA_BYTES, "audio/mpeg")}
+        await client.post(f"{base_url}/v22.0/phone/media", headers=headers, files=files, timeout=MEDIA_TIMEOUT)
+    async with client_for_call() as client:
+        await client.post(f"{base_url}/v22.0/phone/messages", headers=headers, json={"type": "audio"})
+
+
+class _Borrowed:
+    """Async context manager handing out a long-lived client without closing it."""
+
+    def __init__(self, client: httpx.AsyncClient) -> None:
+        self.client = client
+
+    async def __aenter__(self) -> httpx.AsyncClient:
+        return self.client
+
+    async def __aexit__(self, *exc_info) -> None:
+        pass
+
+
+async def measure(base_url: str, turns: int, shared: bool) -> list[float]:
+    verify = not base_url.startswith("https")
+    shared_client = create_http_client(verify=verify) if shared else None
+
+    def client_for_call():
+        if shared_client is not None:
+            return _Borrowed(shared_client)
+        return httpx.AsyncClient(verify=verify)
+
+    timings = []
+    for _ in range(turns):
+        start = time.perf_counter()
+        await audio_turn(base_url, client_for_call)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    if shared_client is not None:
+        await shared_client.aclose()
+    return timings
+
+
+async def main(turns: int, use_tls: bool) -> None:
+    base_url = start_stub(use_tls)
+    print(f"stub Graph API at {base_url}, {turns} audio turns per mode")
+
+    # Warm-up so imports and the stub's first requests do not skew the first mode
+    await measure(base_url, 5, shared=False)
+
+    results = {}
+    for mode, shared in (("per-call", False), ("shared", True)):
+        timings = await measure(base_url, turns, shared)
+        results[mode] = statistics.median(timings)
+        p95 = statistics.quantiles(timings, n=20)[-1]
+        print(f"{mode:>9}: p50 {results[mode]:.2f} ms   p95 {p95:.2f} ms per turn")
+
+    print(f"saved per turn (p50): {results['per-call'] - results['shared']:.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--no-tls", action="store_true", help="Serve the stub over plain HTTP")
+    args = parser.parse_args()
+    asyncio.run(main(args.turns, not args.no_tls))